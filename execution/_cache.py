@@ -0,0 +1,156 @@
+"""
+Response cache for the scrapers.
+
+Identical upstream queries (same endpoint + params/payload) made within the TTL
+are answered from cache instead of spending API credits and a round trip.
+Every successful response is also kept as a 24 h "stale" copy, which is served
+when the upstream call fails.
+
+Backend: Redis when REDIS_URL is set and the redis package is installed,
+otherwise one file per entry under .tmp/http_cache.
+
+Usage:
+    from _cache import fetch_cached, SEARCH_TTL
+    status, body = fetch_cached("GET", url, SEARCH_TTL, params, params=params, timeout=10)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from _http import SESSION
+
+# Per-endpoint freshness, in seconds
+SEARCH_TTL = 10 * 60
+EXTRACT_TTL = 60 * 60
+STALE_TTL = 24 * 60 * 60
+
+CACHE_DIR = Path(__file__).parent.parent / ".tmp" / "http_cache"
+
+# Scripts turn this off for --no-cache
+ENABLED = True
+
+_redis = None
+
+
+def _client():
+    """Connect to Redis on first use; None means use the file backend."""
+    global _redis
+    url = os.getenv("REDIS_URL")
+    if _redis is None and url:
+        try:
+            import redis
+            _redis = redis.Redis.from_url(url, decode_responses=False)
+        except ImportError:
+            pass
+    return _redis
+
+
+def cache_key(endpoint, data):
+    """sha256 of the endpoint plus the canonical JSON of its params or payload."""
+    blob = endpoint + json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return "http:" + hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _path(key):
+    # ':' isn't allowed in Windows file names
+    return CACHE_DIR / (key.replace(":", "_") + ".bin")
+
+
+def cache_get(key):
+    """Return the cached body for key, or None if it is missing or expired."""
+    client = _client()
+    if client is not None:
+        try:
+            return client.get(key)
+        except Exception:
+            return None
+
+    path = _path(key)
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    expires, _, body = raw.partition(b"\n")
+    try:
+        if float(expires) < time.time():
+            return None
+    except ValueError:
+        # Corrupt entry: treat as a miss, the next store overwrites it
+        return None
+    return body
+
+
+def cache_set(key, body, ttl):
+    """Store body under key for ttl seconds."""
+    client = _client()
+    if client is not None:
+        try:
+            client.set(key, body, ex=ttl)
+        except Exception:
+            pass
+        return
+
+    # A failed store only costs a future cache miss; it must never fail the fetch
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: worker threads can store the same key at once
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(f"{time.time() + ttl}\n".encode("ascii") + body)
+            os.replace(tmp, _path(key))
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def fetch_cached(method, url, ttl, key_data, session=SESSION, **kwargs):
+    """
+    Send a request on session (SESSION by default) through the cache and return
+    (status_code, body bytes). A fresh hit skips the network. On a network error
+    or non-200 answer the stale copy is returned instead, if there is one.
+    """
+    if not ENABLED:
+        response = session.request(method, url, **kwargs)
+        return response.status_code, response.content
+
+    key = cache_key(url, key_data)
+    body = cache_get(key)
+    if body is not None:
+        return 200, body
+
+    try:
+        response = session.request(method, url, **kwargs)
+    except requests.RequestException:
+        stale = cache_get(key + ":stale")
+        if stale is None:
+            raise
+        print("⚠️ Upstream unreachable, using cached response.")
+        return 200, stale
+
+    if response.status_code == 200:
+        cache_set(key, response.content, ttl)
+        cache_set(key + ":stale", response.content, STALE_TTL)
+        return 200, response.content
+
+    stale = cache_get(key + ":stale")
+    if stale is not None:
+        print(f"⚠️ Upstream returned {response.status_code}, using cached response.")
+        return 200, stale
+    return response.status_code, response.content
+
+
+def handle_no_cache_flag(argv):
+    """Strip --no-cache from argv and disable the cache if it was given."""
+    global ENABLED
+    if "--no-cache" in argv:
+        argv.remove("--no-cache")
+        ENABLED = False
@@ -0,0 +1,39 @@
+"""
+Shared HTTP sessions for the scrapers.
+
+One keep-alive connection pool per run, so repeated calls to the same host skip
+the TCP + TLS handshake. Rate limits (429) and transient 5xx errors are retried
+with exponential backoff, honouring Retry-After when the server sends it.
+
+SESSION retries idempotent methods only (GET, HEAD, PUT, DELETE, OPTIONS, TRACE).
+A POST is retried only through RETRY_POST_SESSION, which callers pass explicitly
+for endpoints that are safe and cheap to repeat.
+
+Usage:
+    from _http import SESSION
+    response = SESSION.get(url, params=params, timeout=10)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _session(allowed_methods):
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=allowed_methods,
+        # Hand back the last response instead of raising, so callers keep their status checks
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _session(Retry.DEFAULT_ALLOWED_METHODS)
+RETRY_POST_SESSION = _session(Retry.DEFAULT_ALLOWED_METHODS | {"POST"})
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the job filters.
+
+Usage:
+    from _jobs import dedupe_jobs, job_text
+    jobs = dedupe_jobs(load_jobs())
+    text_l = job_text(title, description)
+"""
+
+
+def dedupe_jobs(jobs):
+    """Drop reposted listings: same title, company and description opening."""
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = (job.get("title") or "", job.get("company") or "", (job.get("description") or "")[:512])
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(job)
+    return unique
+
+
+def job_text(title, description):
+    """Title and description as one case-folded string, the form every filter matches on."""
+    return f"{title} {description}".casefold()
@@ -0,0 +1,38 @@
+"""
+JSON helpers for the execution scripts: orjson when it's installed, stdlib json otherwise.
+
+dumps() returns UTF-8 bytes indented by two spaces, non-ASCII kept as-is, so
+it can go straight to Path.write_bytes. loads() accepts bytes or str.
+canonical() returns compact, key-sorted bytes for comparing objects by content.
+write_atomic() replaces a file in one step, so readers never see a half-written one.
+"""
+
+import json
+import os
+
+try:
+    # Rust encoder/decoder, several times faster than the stdlib on job lists and profiles
+    import orjson
+    loads = orjson.loads
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def canonical(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    loads = json.loads  # accepts UTF-8 bytes too
+
+    def dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def canonical(obj):
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
+
+
+def write_atomic(path, data):
+    """Write bytes to a temp file beside path, then rename it into place."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    # Atomic on POSIX and Windows: readers see the old or the new file, never a torn one
+    os.replace(tmp, path)
@@ -0,0 +1,23 @@
+"""
+PDF text extraction for the ingest scripts: PyMuPDF when it's installed, pdfplumber otherwise.
+
+Usage:
+    from _pdf import pdf_text
+    text = pdf_text(path)
+"""
+
+
+def pdf_text(pdf_path):
+    """Return the text of every page, each followed by a newline; pages without text are skipped."""
+    try:
+        import fitz  # PyMuPDF: C engine, far faster than pdfplumber for plain text
+    except ImportError:
+        fitz = None
+    if fitz is not None:
+        with fitz.open(pdf_path) as pdf:
+            pages = [page.get_text() for page in pdf]
+    else:
+        import pdfplumber
+        with pdfplumber.open(pdf_path) as pdf:
+            pages = [page.extract_text() for page in pdf.pages]
+    return "".join(page_text + "\n" for page_text in pages if page_text)
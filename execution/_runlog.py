@@ -0,0 +1,36 @@
+"""
+Run logs for the execution scripts, under .tmp/<name>.log.
+
+The file is opened once per run with a 64 KiB buffer instead of being reopened
+for every line, and closed (so flushed) at exit, including on sys.exit and on
+an uncaught exception.
+
+Usage:
+    from _runlog import open_log
+    log = open_log("ingest_cv", echo=True)
+    log("Starting ingest_cv.py...")
+"""
+
+import atexit
+from pathlib import Path
+
+LOG_DIR = Path(__file__).parent.parent / ".tmp"
+
+
+def open_log(name, echo=False):
+    """Open .tmp/<name>.log for appending and return a log(msg) function for it; echo also prints."""
+    try:
+        LOG_DIR.mkdir(exist_ok=True)
+        fh = open(LOG_DIR / f"{name}.log", "a", encoding="utf-8", buffering=1 << 16)
+        atexit.register(fh.close)
+    except OSError:
+        fh = None  # Logging must never stop a run
+
+    def log(msg):
+        msg = str(msg)
+        if fh is not None:
+            fh.write(msg + "\n")
+        if echo:
+            print(msg)
+
+    return log
@@ -8,6 +8,8 @@ import os
 from pathlib import Path
 import re
 
+from _jobs import dedupe_jobs, job_text
+
 def load_profile():
     profile_path = Path(__file__).parent.parent / ".tmp" / "user_profile.json"
     if not profile_path.exists():
@@ -24,15 +26,15 @@ def load_jobs():
     with open(jobs_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def matches_location_strict(job, desired_city="Berlin"):
+def matches_location_strict(loc, text_l, desired_city="Berlin"):
     """Temporarily relaxed: Allow all locations for stress test."""
     return True
 
-def matches_language_strict(job):
+def matches_language_strict(text_l):
     """Temporarily relaxed: Allow all languages for stress test."""
     return True, "Language Check Disabled"
 
-def matches_level_strict(job):
+def matches_level_strict(title_l):
     """Temporarily relaxed: Allow Senior/Lead roles for stress test."""
     return True, "Level Check Disabled"
 
@@ -42,20 +44,28 @@ def filter_jobs(jobs, profile):
     print("\n--- Filtering Log ---")
     
     for job in jobs:
+        # Case-fold once per job; every matcher works on these
+        g = job.get
+        title = g("title") or ""
+        desc = g("description") or ""
+        loc = g("location") or ""
+        title_l = title.casefold()
+        text_l = job_text(title, desc)
+
         # 1. Location Matching
-        if not matches_location_strict(job, "Berlin"):
+        if not matches_location_strict(loc, text_l, "Berlin"):
             continue
             
         # 2. Level Matching
-        level_ok, level_msg = matches_level_strict(job)
+        level_ok, level_msg = matches_level_strict(title_l)
         if not level_ok:
-            # print(f"Skipping {job['title']}: {level_msg}")
+            # print(f"Skipping {title}: {level_msg}")
             continue
             
         # 3. Language Matching (Most expensive/strict)
-        lang_ok, lang_msg = matches_language_strict(job)
+        lang_ok, lang_msg = matches_language_strict(text_l)
         if not lang_ok:
-            print(f"Skipping {job['title']}: {lang_msg}")
+            print(f"Skipping {title}: {lang_msg}")
             continue
             
         # Passed all checks
@@ -76,6 +86,10 @@ def save_filtered_jobs(jobs):
 def main():
     profile = load_profile()
     jobs = load_jobs()
+    total = len(jobs)
+    jobs = dedupe_jobs(jobs)
+    if len(jobs) < total:
+        print(f"Removed {total - len(jobs)} duplicate listings.")
     
     print(f"Processing {len(jobs)} jobs against strict filters (Berlin / English / Entry)...")
     
@@ -3,6 +3,14 @@ import re
 import sys
 from pathlib import Path
 
+from _jobs import dedupe_jobs, job_text
+
+try:
+    # Linear-time DFA matcher; same compile/findall API as `re`
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 # Setup logging
 log_path = Path(__file__).parent.parent / ".tmp" / "filter_jobs.log"
 def log(msg):
@@ -18,6 +26,12 @@ SKILL_KEYWORDS = [
     "Agile", "Scrum", "Jira", "CI/CD", "TDD", "Excel"
 ]
 
+# One fused pattern over the case-folded job text, longest skills first
+_SKILL_BY_FOLDED = {s.casefold(): s for s in SKILL_KEYWORDS}
+_SKILL_RE = _regex.compile(
+    r'\b(' + '|'.join(re.escape(s) for s in sorted(_SKILL_BY_FOLDED, key=len, reverse=True)) + r')\b'
+)
+
 def load_json(path):
     if not path.exists():
         log(f"Error: {path} not found.")
@@ -25,14 +39,9 @@ def load_json(path):
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def extract_skills_from_text(text):
-    text_lower = text.lower()
-    found = set()
-    for skill in SKILL_KEYWORDS:
-        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            found.add(skill)
-    return found
+def extract_skills_from_text(text_l):
+    """Skills mentioned in already case-folded text (see job_text)."""
+    return {_SKILL_BY_FOLDED[m] for m in _SKILL_RE.findall(text_l)}
 
 def filter_jobs():
     log("Starting filter_jobs_advanced.py...")
@@ -49,6 +58,11 @@ def filter_jobs():
         log("Missing jobs or profile data.")
         return
 
+    total = len(jobs)
+    jobs = dedupe_jobs(jobs)
+    if len(jobs) < total:
+        log(f"Removed {total - len(jobs)} duplicate listings.")
+
     # Normalize user skills
     user_skills = set()
     raw_skills = profile.get("skills", [])
@@ -66,11 +80,12 @@ def filter_jobs():
     filtered_jobs = []
     
     for job in jobs:
-        title = job.get("title", "")
-        desc = job.get("description", "")
-        text = f"{title} {desc}"
+        g = job.get
+        title = g("title") or ""
+        desc = g("description") or ""
+        text_l = job_text(title, desc)
         
-        job_skills = extract_skills_from_text(text)
+        job_skills = extract_skills_from_text(text_l)
         
         # If job lists NO skills, assume it's generic and maybe pass? 
         # But for "50% match", we strictly need skills.
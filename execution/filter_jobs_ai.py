@@ -9,6 +9,7 @@ Requires:
     GEMINI_API_KEY in .env
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -18,9 +19,15 @@ from dotenv import load_dotenv
 import google.generativeai as genai
 import typing_extensions as typing
 
+from _jobs import dedupe_jobs
+
 # Load environment variables
 load_dotenv()
 
+# Gemini limits: keep a few calls in flight, never exceed the per-minute quota
+MAX_CONCURRENCY = 4
+REQUESTS_PER_MINUTE = 60
+
 # Logging
 log_path = Path(__file__).parent.parent / ".tmp" / "ai_scoring.log"
 def log(msg):
@@ -63,8 +70,29 @@ def summarize_profile(profile):
         
     return summary
 
-def score_job(model, job, profile_summary):
-    """Ask Gemini to score the job match."""
+class RateLimiter:
+    """Token bucket shared by all scoring tasks: `rate` calls per `period` seconds."""
+
+    def __init__(self, rate, period=60.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.period)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+
+async def score_job_async(model, job, profile_summary, semaphore, limiter):
+    """Ask Gemini to score the job match without blocking the other jobs."""
     
     prompt = f"""
     Act as a Technical Recruiter. Evaluate this job match.
@@ -94,14 +122,19 @@ def score_job(model, job, profile_summary):
     retries = 3
     for attempt in range(retries):
         try:
-            response = model.generate_content(prompt, generation_config={"response_mime_type": "application/json"})
+            async with semaphore:
+                await limiter.acquire()
+                response = await model.generate_content_async(
+                    prompt, generation_config={"response_mime_type": "application/json"}
+                )
             return json.loads(response.text)
         except Exception as e:
             error_str = str(e)
             if "429" in error_str or "Quota exceeded" in error_str:
                 wait_time = 20 * (attempt + 1)
-                print(f"   ⏳ Rate limit hit. Waiting {wait_time}s...")
-                time.sleep(wait_time)
+                print(f"   ⏳ Rate limit hit on '{job.get('title', '')[:40]}'. Retrying in {wait_time}s...")
+                # Sleep outside the semaphore so other jobs keep going
+                await asyncio.sleep(wait_time)
                 continue
             
             print(f"   ⚠️ AI Error: {e}")
@@ -110,6 +143,21 @@ def score_job(model, job, profile_summary):
     
     return {"score": 0, "reason": "Rate limit exceeded after retries", "missing_skills": [], "matched_skills": []}
 
+async def score_jobs(model, jobs, profile_summary):
+    """Score all jobs concurrently; results are returned in the same order as `jobs`."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    limiter = RateLimiter(REQUESTS_PER_MINUTE, 60)
+    total = len(jobs)
+
+    async def run(i, job):
+        analysis = await score_job_async(model, job, profile_summary, semaphore, limiter)
+        score = analysis.get("score", 0)
+        log(f"   Processed {i}/{total}: {job.get('title')[:40]} -> Score: {score}. Reason: {analysis.get('reason', 'None')}")
+        print(f"   Processed {i}/{total}: {job.get('title')[:40]}... -> Score: {score}")
+        return analysis
+
+    return await asyncio.gather(*(run(i, job) for i, job in enumerate(jobs, 1)))
+
 def main():
     print("🧠 AI Job Scorer (Powered by Gemini)")
     
@@ -121,6 +169,10 @@ def main():
     print("   Loading data...")
     profile = load_json(tmp_dir / "user_profile.json")
     jobs = load_json(tmp_dir / "jobs_found.json")
+    total = len(jobs)
+    jobs = dedupe_jobs(jobs)
+    if len(jobs) < total:
+        print(f"   Removed {total - len(jobs)} duplicate listings.")
     
     profile_summary = summarize_profile(profile)
     
@@ -130,25 +182,17 @@ def main():
     print(f"   Scoring {len(jobs)} jobs (Threshold: {min_score}/100)...")
     print("-" * 50)
     
-    for i, job in enumerate(jobs, 1):
-        log(f"   Processing {i}/{len(jobs)}: {job.get('title')[:40]}...")
-        print(f"   Processing {i}/{len(jobs)}: {job.get('title')[:40]}...", end="", flush=True)
-        
-        analysis = score_job(model, job, profile_summary)
+    analyses = asyncio.run(score_jobs(model, jobs, profile_summary))
+
+    for job, analysis in zip(jobs, analyses):
         score = analysis.get("score", 0)
-        
-        log(f" -> Score: {score}. Reason: {analysis.get('reason', 'None')}")
-        print(f" -> Score: {score}")
-        
+
         # Add AI analysis to job object
         job["match_score"] = score
         job["ai_analysis"] = analysis
         
         if score >= min_score:
             filtered_jobs.append(job)
-            
-        # Avoid rate limits (Conservative 5s delay)
-        time.sleep(5)
         
     # Save Results
     output_path = tmp_dir / "jobs_filtered.json"
@@ -26,42 +26,150 @@ Outputs:
     - .tmp/applications/{company_name}/cv.pdf
 """
 
-import json
+import copy
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+
+# python-docx (and lxml) are imported on first use in _make_base_doc and
+# create_ats_friendly_cv, so importing this module stays cheap
+
+from _jsonio import loads
+from _runlog import open_log
+
 try:
-    from docx import Document
-    from docx.shared import Pt, Inches, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    import ahocorasick
 except ImportError:
-    # We can't use os.system like this safely, but assuming requirements are there
-    from docx import Document
-    from docx.shared import Pt, Inches, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    ahocorasick = None
+
+# Paths, resolved once at import
+_ROOT = Path(__file__).resolve().parent.parent
+_TMP = _ROOT / ".tmp"
+_PROFILE_PATH = _TMP / "user_profile.json"
+_JOBS_PATH = _TMP / "jobs_filtered.json"
+_APPS_DIR = _TMP / "applications"
 
 # Setup logging
-log_path = Path(__file__).parent.parent / ".tmp" / "generate_cv.log"
-def log(msg):
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
+log = open_log("generate_cv")
+
+
+# Common technical skills to look for in job postings
+TECH_KEYWORDS = (
+    'python', 'javascript', 'java', 'c++', 'react', 'vue', 'angular',
+    'node.js', 'django', 'flask', 'fastapi', 'express', 'spring',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
+    'postgresql', 'mongodb', 'redis', 'mysql', 'sql',
+    'git', 'ci/cd', 'agile', 'scrum', 'microservices',
+    'rest api', 'graphql', 'websockets', 'tensorflow', 'pytorch',
+    'machine learning', 'ai', 'data science', 'analytics',
+    'leadership', 'mentoring', 'team lead', 'architect'
+)
+
+# Single-pass matcher over all keywords, built once at import
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in TECH_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+# CV paragraph styles: name -> (size in pt, bold, italic)
+CV_STYLES = {
+    'Calibri16Bold': (16, True, False),
+    'Calibri12Bold': (12, True, False),
+    'Calibri11Bold': (11, True, False),
+    'Calibri11': (11, False, False),
+    'Calibri10Italic': (10, False, True),
+    'Calibri10': (10, False, False),
+}
+
+
+# Skill categorization keywords
+_LANG = frozenset({'python', 'javascript', 'java', 'c++', 'go', 'rust', 'ruby'})
+_FW = frozenset({'react', 'vue', 'angular', 'django', 'flask', 'spring'})
+_DB = frozenset({'sql', 'postgres', 'mysql', 'mongo', 'redis'})
+_CLOUD = frozenset({'aws', 'azure', 'gcp', 'docker', 'kubernetes'})
+
+_SKILL_CATEGORIES = (
+    ('Programming Languages', _LANG),
+    ('Frameworks & Libraries', _FW),
+    ('Databases', _DB),
+    ('Cloud & DevOps', _CLOUD),
+)
+
+
+def categorize_skill(skill_name):
+    """
+    CV skills category for a skill name.
+    
+    Exact names are a set lookup; longer names like 'PostgreSQL 14' fall back
+    to substring matching in category order.
+    """
+    name = skill_name.lower().strip()
+    for category, keywords in _SKILL_CATEGORIES:
+        if name in keywords:
+            return category
+    for category, keywords in _SKILL_CATEGORIES:
+        if any(keyword in name for keyword in keywords):
+            return category
+    return 'Tools & Technologies'
 
-log("Starting generate_cv.py...")
 
+def _make_base_doc():
+    """
+    Blank CV document, deep-copied for each job.
+    
+    Sets 1 inch margins and defines the CV paragraph styles, so paragraphs
+    only pick a style instead of formatting every run.
+    """
+    from docx import Document
+    from docx.shared import Pt, Inches, RGBColor
+    from docx.enum.style import WD_STYLE_TYPE
+    
+    # Lengths are immutable ints, so one instance can be shared
+    margin = Inches(1)
+    body_size = Pt(11)
+    
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = margin
+        section.bottom_margin = margin
+        section.left_margin = margin
+        section.right_margin = margin
+    
+    normal = doc.styles['Normal']
+    for name, (size, bold, italic) in CV_STYLES.items():
+        style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal
+        style.font.name = 'Calibri'
+        style.font.size = Pt(size)
+        style.font.bold = bold or None
+        style.font.italic = italic or None
+    doc.styles['Calibri12Bold'].font.color.rgb = RGBColor(0, 0, 0)  # Pure black for ATS
+    
+    # Built-in styles used for the summary and achievement bullets
+    for name in ('Body Text', 'List Bullet'):
+        doc.styles[name].font.name = 'Calibri'
+        doc.styles[name].font.size = body_size
+    return doc
+
+
+# Parsing the default docx template is the slow part of Document(); do it
+# once per process, on the first CV
+_BASE_DOC = None
 
 
 def load_profile():
     """Load user profile."""
-    profile_path = Path(__file__).parent.parent / ".tmp" / "user_profile.json"
-    with open(profile_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return loads(_PROFILE_PATH.read_bytes())
 
 
 def load_jobs():
     """Load filtered jobs."""
-    jobs_path = Path(__file__).parent.parent / ".tmp" / "jobs_filtered.json"
-    with open(jobs_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return loads(_JOBS_PATH.read_bytes())
 
 
 def extract_keywords_from_job(job):
@@ -71,27 +179,94 @@ def extract_keywords_from_job(job):
     """
     text = f"{job.get('title', '')} {job.get('description', '')}".lower()
     
-    # Common technical skills to look for
-    tech_keywords = [
-        'python', 'javascript', 'java', 'c++', 'react', 'vue', 'angular',
-        'node.js', 'django', 'flask', 'fastapi', 'express', 'spring',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
-        'postgresql', 'mongodb', 'redis', 'mysql', 'sql',
-        'git', 'ci/cd', 'agile', 'scrum', 'microservices',
-        'rest api', 'graphql', 'websockets', 'tensorflow', 'pytorch',
-        'machine learning', 'ai', 'data science', 'analytics',
-        'leadership', 'mentoring', 'team lead', 'architect'
-    ]
+    if _KEYWORD_AUTOMATON is not None:
+        return list({keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text)})
+    
+    # Fallback: plain substring checks (a regex alternation would miss
+    # overlapping hits such as 'java' inside 'javascript')
+    return list({keyword for keyword in TECH_KEYWORDS if keyword in text})
+
+
+def precompute_profile(profile):
+    """
+    Build the job-independent parts of the CV once per run.
+    
+    The per-job loop only adds the tailored summary on top of these.
+    Education is returned as (text, style) tuples, with None marking an
+    empty spacing paragraph.
+    """
+    personal_info = profile.get('personal_info', {})
+    
+    # Contact info - one line
+    contact_parts = []
+    if personal_info.get('email'):
+        contact_parts.append(personal_info['email'])
+    if personal_info.get('phone'):
+        contact_parts.append(personal_info['phone'])
+    if personal_info.get('location', {}).get('city'):
+        loc = personal_info['location']
+        location_str = f"{loc.get('city', '')}, {loc.get('state', '')}" if loc.get('state') else loc.get('city', '')
+        contact_parts.append(location_str)
+    
+    # Links - one line
+    links_parts = []
+    if personal_info.get('linkedin'):
+        links_parts.append(personal_info['linkedin'])
+    if personal_info.get('github'):
+        links_parts.append(personal_info['github'])
+    if personal_info.get('portfolio'):
+        links_parts.append(personal_info['portfolio'])
+    
+    # Education paragraphs
+    education = []
+    for edu in profile.get('education', []):
+        degree_text = f"{edu.get('degree', '')} in {edu.get('field_of_study', '')}" if edu.get('field_of_study') else edu.get('degree', '')
+        education.append((f"{degree_text} | {edu.get('institution', '')}", 'Calibri11Bold'))
+        if edu.get('end_date'):
+            education.append((f"Graduated: {edu['end_date']}", 'Calibri10Italic'))
+        if edu.get('gpa') and edu['gpa'] >= 3.5:  # GPA if notable
+            education.append((f"GPA: {edu['gpa']}/4.0", 'Calibri10'))
+        education.append(None)  # Spacing
+    
+    skills_data = profile.get('skills', [])
+    skills = []
     
-    found_keywords = set()
-    for keyword in tech_keywords:
-        if keyword in text:
-            found_keywords.add(keyword)
+    if isinstance(skills_data, list):
+        # Handle flat list from ingest_cv.py
+        # Create dummy dict objects for compatibility or just use strings
+        skills = [{'name': s} for s in skills_data if isinstance(s, str)]
+        # Also handle if list already contains dicts
+        skills.extend([s for s in skills_data if isinstance(s, dict)])
+    elif isinstance(skills_data, dict):
+        # Handle legacy dict format
+        skills = skills_data.get('technical', [])
     
-    return list(found_keywords)
+    # Group skills by category for better ATS parsing
+    skill_categories = {
+        'Programming Languages': [],
+        'Frameworks & Libraries': [],
+        'Databases': [],
+        'Cloud & DevOps': [],
+        'Tools & Technologies': []
+    }
+    
+    for skill in skills:
+        skill_name = skill.get('name', '')
+        # Simple categorization (in production, this would be smarter)
+        skill_categories[categorize_skill(skill_name)].append(skill_name)
+    
+    return {
+        'full_name': personal_info.get('full_name', 'Your Name'),
+        'headline': personal_info.get('professional_headline', 'Software Engineer'),
+        'total_years': len(profile.get('work_experience', [])) * 1.5,  # Rough estimate
+        'contact_parts': contact_parts,
+        'links_parts': links_parts,
+        'education': education,
+        'skill_categories': skill_categories,
+    }
 
 
-def create_ats_friendly_cv(profile, job, keywords):
+def create_ats_friendly_cv(profile, job, keywords, precomputed):
     """
     Create an ATS-friendly CV in DOCX format.
     
@@ -105,59 +280,27 @@ def create_ats_friendly_cv(profile, job, keywords):
     - Keywords from job description
     - Reverse chronological order
     """
-    doc = Document()
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     
-    # Set document margins (1 inch all around)
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
+    global _BASE_DOC
+    if _BASE_DOC is None:
+        _BASE_DOC = _make_base_doc()
+    doc = copy.deepcopy(_BASE_DOC)  # 1 inch margins all around
     
     # HEADER: Name and Contact (ATS-friendly format)
-    personal_info = profile.get('personal_info', {})
-    
     # Name - Large, bold
-    name_para = doc.add_paragraph()
-    name_run = name_para.add_run(personal_info.get('full_name', 'Your Name'))
-    name_run.font.size = Pt(16)
-    name_run.font.bold = True
-    name_run.font.name = 'Calibri'
+    name_para = doc.add_paragraph(precomputed['full_name'], style='Calibri16Bold')
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # Contact info - one line, centered
-    contact_parts = []
-    if personal_info.get('email'):
-        contact_parts.append(personal_info['email'])
-    if personal_info.get('phone'):
-        contact_parts.append(personal_info['phone'])
-    if personal_info.get('location', {}).get('city'):
-        loc = personal_info['location']
-        location_str = f"{loc.get('city', '')}, {loc.get('state', '')}" if loc.get('state') else loc.get('city', '')
-        contact_parts.append(location_str)
-    
-    contact_para = doc.add_paragraph(' | '.join(contact_parts))
+    contact_para = doc.add_paragraph(' | '.join(precomputed['contact_parts']), style='Calibri11')
     contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    contact_run = contact_para.runs[0]
-    contact_run.font.size = Pt(11)
-    contact_run.font.name = 'Calibri'
     
     # Links - one line, centered
-    links_parts = []
-    if personal_info.get('linkedin'):
-        links_parts.append(personal_info['linkedin'])
-    if personal_info.get('github'):
-        links_parts.append(personal_info['github'])
-    if personal_info.get('portfolio'):
-        links_parts.append(personal_info['portfolio'])
-    
+    links_parts = precomputed['links_parts']
     if links_parts:
-        links_para = doc.add_paragraph(' | '.join(links_parts))
+        links_para = doc.add_paragraph(' | '.join(links_parts), style='Calibri10')
         links_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        links_run = links_para.runs[0]
-        links_run.font.size = Pt(10)
-        links_run.font.name = 'Calibri'
     
     doc.add_paragraph()  # Spacing
     
@@ -165,12 +308,8 @@ def create_ats_friendly_cv(profile, job, keywords):
     add_section_header(doc, 'PROFESSIONAL SUMMARY')
     
     # Generate a tailored summary (in production, this would use AI)
-    summary_text = generate_summary(profile, job, keywords)
-    summary_para = doc.add_paragraph(summary_text)
-    summary_para.style = 'Body Text'
-    for run in summary_para.runs:
-        run.font.size = Pt(11)
-        run.font.name = 'Calibri'
+    summary_text = generate_summary(precomputed, job, keywords)
+    doc.add_paragraph(summary_text, style='Body Text')
     
     doc.add_paragraph()  # Spacing
     
@@ -180,111 +319,39 @@ def create_ats_friendly_cv(profile, job, keywords):
     work_experience = profile.get('work_experience', [])
     for exp in work_experience[:5]:  # Limit to 5 most recent
         # Company and Title - Bold
-        title_para = doc.add_paragraph()
-        title_run = title_para.add_run(f"{exp.get('title', 'Position')} | {exp.get('company', 'Company')}")
-        title_run.font.bold = True
-        title_run.font.size = Pt(11)
-        title_run.font.name = 'Calibri'
+        doc.add_paragraph(f"{exp.get('title', 'Position')} | {exp.get('company', 'Company')}", style='Calibri11Bold')
         
         # Dates and Location
-        dates_para = doc.add_paragraph()
         start = exp.get('start_date', '')
         end = exp.get('end_date', 'Present') if not exp.get('current') else 'Present'
         location = exp.get('location', '')
-        dates_run = dates_para.add_run(f"{start} – {end} | {location}")
-        dates_run.font.size = Pt(10)
-        dates_run.font.name = 'Calibri'
-        dates_run.font.italic = True
+        doc.add_paragraph(f"{start} – {end} | {location}", style='Calibri10Italic')
         
         # Achievements - tailored to emphasize relevant keywords
         achievements = exp.get('achievements', [])
         if achievements:
             for achievement in achievements[:4]:  # Max 4 bullets per job
-                bullet_para = doc.add_paragraph(achievement, style='List Bullet')
-                for run in bullet_para.runs:
-                    run.font.size = Pt(11)
-                    run.font.name = 'Calibri'
+                doc.add_paragraph(achievement, style='List Bullet')
         
         doc.add_paragraph()  # Spacing between jobs
     
     # EDUCATION
     add_section_header(doc, 'EDUCATION')
     
-    education = profile.get('education', [])
-    for edu in education:
-        # Degree and Institution - Bold
-        edu_para = doc.add_paragraph()
-        degree_text = f"{edu.get('degree', '')} in {edu.get('field_of_study', '')}" if edu.get('field_of_study') else edu.get('degree', '')
-        edu_run = edu_para.add_run(f"{degree_text} | {edu.get('institution', '')}")
-        edu_run.font.bold = True
-        edu_run.font.size = Pt(11)
-        edu_run.font.name = 'Calibri'
-        
-        # Dates
-        if edu.get('end_date'):
-            date_para = doc.add_paragraph(f"Graduated: {edu['end_date']}")
-            for run in date_para.runs:
-                run.font.size = Pt(10)
-                run.font.name = 'Calibri'
-                run.font.italic = True
-        
-        # GPA if notable
-        if edu.get('gpa') and edu['gpa'] >= 3.5:
-            gpa_para = doc.add_paragraph(f"GPA: {edu['gpa']}/4.0")
-            for run in gpa_para.runs:
-                run.font.size = Pt(10)
-                run.font.name = 'Calibri'
-        
-        doc.add_paragraph()  # Spacing
+    for entry in precomputed['education']:
+        if entry is None:
+            doc.add_paragraph()  # Spacing
+        else:
+            doc.add_paragraph(*entry)
     
     # TECHNICAL SKILLS (keyword-optimized)
     add_section_header(doc, 'TECHNICAL SKILLS')
     
-    skills_data = profile.get('skills', [])
-    skills = []
-    
-    if isinstance(skills_data, list):
-        # Handle flat list from ingest_cv.py
-        # Create dummy dict objects for compatibility or just use strings
-        skills = [{'name': s} for s in skills_data if isinstance(s, str)]
-        # Also handle if list already contains dicts
-        skills.extend([s for s in skills_data if isinstance(s, dict)])
-    elif isinstance(skills_data, dict):
-        # Handle legacy dict format
-        skills = skills_data.get('technical', [])
-
-    
-    # Group skills by category for better ATS parsing
-    skill_categories = {
-        'Programming Languages': [],
-        'Frameworks & Libraries': [],
-        'Databases': [],
-        'Cloud & DevOps': [],
-        'Tools & Technologies': []
-    }
-    
-    for skill in skills:
-        skill_name = skill.get('name', '')
-        # Simple categorization (in production, this would be smarter)
-        if any(lang in skill_name.lower() for lang in ['python', 'javascript', 'java', 'c++', 'go', 'rust', 'ruby']):
-            skill_categories['Programming Languages'].append(skill_name)
-        elif any(fw in skill_name.lower() for fw in ['react', 'vue', 'angular', 'django', 'flask', 'spring']):
-            skill_categories['Frameworks & Libraries'].append(skill_name)
-        elif any(db in skill_name.lower() for db in ['sql', 'postgres', 'mysql', 'mongo', 'redis']):
-            skill_categories['Databases'].append(skill_name)
-        elif any(cloud in skill_name.lower() for cloud in ['aws', 'azure', 'gcp', 'docker', 'kubernetes']):
-            skill_categories['Cloud & DevOps'].append(skill_name)
-        else:
-            skill_categories['Tools & Technologies'].append(skill_name)
-    
-    for category, category_skills in skill_categories.items():
+    for category, category_skills in precomputed['skill_categories'].items():
         if category_skills:
-            skills_para = doc.add_paragraph()
-            skills_para.add_run(f"{category}: ").font.bold = True
+            skills_para = doc.add_paragraph(style='Calibri11')
+            skills_para.add_run(f"{category}: ").bold = True
             skills_para.add_run(', '.join(category_skills[:10]))  # Max 10 per category
-            for run in skills_para.runs:
-                run.font.size = Pt(11)
-                run.font.name = 'Calibri'
     
     # CERTIFICATIONS (if any)
     certifications = profile.get('certifications', [])
@@ -293,10 +360,7 @@ def create_ats_friendly_cv(profile, job, keywords):
         add_section_header(doc, 'CERTIFICATIONS')
         
         for cert in certifications[:5]:  # Max 5
-            cert_para = doc.add_paragraph()
-            cert_run = cert_para.add_run(f"{cert.get('name', '')} - {cert.get('issuing_organization', '')}")
-            cert_run.font.size = Pt(11)
-            cert_run.font.name = 'Calibri'
+            cert_para = doc.add_paragraph(f"{cert.get('name', '')} - {cert.get('issuing_organization', '')}", style='Calibri11')
             
             if cert.get('issue_date'):
                 cert_para.add_run(f" ({cert['issue_date']})")
@@ -306,31 +370,30 @@ def create_ats_friendly_cv(profile, job, keywords):
 
 def add_section_header(doc, text):
     """Add a section header in ATS-friendly format."""
-    header = doc.add_paragraph(text)
-    header_run = header.runs[0]
-    header_run.font.size = Pt(12)
-    header_run.font.bold = True
-    header_run.font.name = 'Calibri'
-    header_run.font.color.rgb = RGBColor(0, 0, 0)  # Pure black for ATS
-    
-    # Add a line below header for visual separation
-    # (ATS-friendly: just a paragraph with underline, not a table)
-    line = doc.add_paragraph('_' * 80)
-    for run in line.runs:
-        run.font.size = Pt(8)
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    
+    header = doc.add_paragraph(text, style='Calibri12Bold')
+    
+    # Bottom border below header for visual separation
+    # (ATS-friendly: paragraph formatting, not a table or extra paragraph)
+    bottom = OxmlElement('w:bottom')
+    bottom.set(qn('w:val'), 'single')
+    bottom.set(qn('w:sz'), '6')
+    bottom.set(qn('w:space'), '1')
+    bottom.set(qn('w:color'), '000000')
+    border = OxmlElement('w:pBdr')
+    border.append(bottom)
+    header._p.get_or_add_pPr().append(border)
 
 
-def generate_summary(profile, job, keywords):
+def generate_summary(precomputed, job, keywords):
     """
     Generate a tailored professional summary.
     In production, this would use AI. For now, it's template-based.
     """
-    personal_info = profile.get('personal_info', {})
-    headline = personal_info.get('professional_headline', 'Software Engineer')
-    
-    # Count years of experience
-    work_exp = profile.get('work_experience', [])
-    total_years = len(work_exp) * 1.5  # Rough estimate
+    headline = precomputed['headline']
+    total_years = precomputed['total_years']
     
     # Highlight matching keywords
     keyword_str = ', '.join(keywords[:5]) if keywords else 'modern technologies'
@@ -338,21 +401,35 @@ def generate_summary(profile, job, keywords):
     summary = (
         f"{headline} with {int(total_years)}+ years of experience building scalable applications. "
         f"Expertise in {keyword_str}. Proven track record of delivering high-impact projects. "
-        f"Seeking to contribute technical excellence to {job.get('company', 'your team')} as a {job.get('title', 'Software Engineer')}."
+        f"Seeking to contribute technical excellence to {job.get('company') or 'your team'} as a {job.get('title', 'Software Engineer')}."
     )
     
     return summary
 
 
+# Characters that are unsafe or awkward in a folder name
+_SANITIZE = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
+
+def company_folder(company_name):
+    """Folder name used for a company's application documents."""
+    return company_name.translate(_SANITIZE)
+
+
 def save_cv(doc, company_name):
     """Save CV as DOCX and PDF."""
-    # Create company folder
-    app_dir = Path(__file__).parent.parent / ".tmp" / "applications" / company_name.replace(' ', '_').replace('/', '_')
-    app_dir.mkdir(parents=True, exist_ok=True)
+    # Create company folder (main() creates _APPS_DIR itself up front)
+    app_dir = _APPS_DIR / company_folder(company_name)
+    try:
+        app_dir.mkdir()
+    except FileExistsError:
+        pass
     
     # Save DOCX (ATS-friendly)
     docx_path = app_dir / "cv.docx"
-    doc.save(str(docx_path))
+    # Large buffer so the zip parts go out in a few writes, not many small ones
+    with open(docx_path, 'wb', buffering=1 << 20) as f:
+        doc.save(f)
     
     # PDF conversion (optional, DOCX is more ATS-friendly)
     # For now, just save DOCX
@@ -361,6 +438,34 @@ def save_cv(doc, company_name):
     return docx_path
 
 
+# Run-wide inputs for worker processes, set once per worker by _init_worker
+_PROFILE = None
+_PRECOMPUTED = None
+
+
+def _init_worker(profile, precomputed):
+    """Receive the profile once per worker process instead of once per job."""
+    global _PROFILE, _PRECOMPUTED
+    _PROFILE = profile
+    _PRECOMPUTED = precomputed
+
+
+def _process_jobs(batch):
+    """
+    Generate and save CVs for a batch of (index, job) pairs in a worker process.
+    
+    All jobs in a batch share a company folder, so they run in order here
+    rather than racing on the same cv.docx.
+    """
+    results = []
+    for i, job in batch:
+        keywords = extract_keywords_from_job(job)
+        doc = create_ats_friendly_cv(_PROFILE, job, keywords, _PRECOMPUTED)
+        cv_path = save_cv(doc, job.get('company') or 'Unknown Company')
+        results.append((i, job, keywords, cv_path))
+    return results
+
+
 def main():
     log("ATS-Friendly CV Generator\n")
     
@@ -374,23 +479,29 @@ def main():
     
     log(f"Found {len(jobs)} jobs to generate CVs for\n")
     
-    # Generate CVs
+    # Profile-derived sections are the same for every job
+    precomputed = precompute_profile(profile)
+    
+    _APPS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Jobs at the same company write to the same folder, so batch them together
+    batches = {}
     for i, job in enumerate(jobs, 1):
-        company = job.get('company', 'Unknown Company')
-        title = job.get('title', 'Position')
-        
-        log(f"{i}. Generating CV for: {title} at {company}")
-        
-        # Extract keywords
-        keywords = extract_keywords_from_job(job)
-        log(f"   Keywords: {', '.join(keywords[:5])}")
-        
-        # Generate CV
-        doc = create_ats_friendly_cv(profile, job, keywords)
-        
-        # Save
-        cv_path = save_cv(doc, company)
-        log(f"   Saved: {cv_path}\n")
+        folder = company_folder(job.get('company') or 'Unknown Company')
+        batches.setdefault(folder, []).append((i, job))
+    
+    # Generate CVs in parallel; documents are CPU-bound lxml work
+    workers = min(len(batches), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(profile, precomputed)) as executor:
+        futures = [executor.submit(_process_jobs, batch) for batch in batches.values()]
+        for future in as_completed(futures):
+            for i, job, keywords, cv_path in future.result():
+                company = job.get('company') or 'Unknown Company'
+                title = job.get('title', 'Position')
+                log(f"{i}. Generated CV for: {title} at {company}")
+                log(f"   Keywords: {', '.join(keywords[:5])}")
+                log(f"   Saved: {cv_path}\n")
     
     log(f"\nGenerated {len(jobs)} ATS-friendly CVs!")
     log(f"Location: .tmp/applications/")
@@ -401,6 +512,7 @@ def main():
 
 
 if __name__ == "__main__":
+    log("Starting generate_cv.py...")
     try:
         main()
     except Exception as e:
@@ -1,24 +1,60 @@
-import json
 import os
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+from _jsonio import loads
 
 # Config
 BASE_DIR = Path(__file__).parent.parent
 PROFILE_FILE = BASE_DIR / ".tmp" / "user_profile.json"
 OUTPUT_FILE = BASE_DIR / ".tmp" / "generated_cv_german.md"
 
+# Fixed blocks of the CV, filled with str.format at render time
+_HEADER_TEMPLATE = (
+    "# LEBENSLAUF\n\n"
+    # 1. Persönliche Daten (Personal Details) - Critical for Germany
+    "## PERSÖNLICHE DATEN\n\n"
+    "**Name:** {name}\n\n"
+    "**Adresse:** {address}\n\n"
+    "**Telefon:** {phone}\n\n"
+    "**E-Mail:** {email}\n\n"
+)
+_PHOTO_PLACEHOLDER = (
+    "> ![Bewerbungsfoto](path/to/photo.jpg)\n"
+    "> *Hinweis: Ein professionelles Foto wird in Deutschland oft noch erwartet.*\n\n"
+)
+_FOOTER_TEMPLATE = "---\n\n{date}, {city}\n\n\n(Unterschrift)\n"
+_REMOTE_MAP = {
+    'remote-only': 'Nur Remote',
+    'hybrid': 'Hybrid',
+    'on-site': 'Vor Ort'
+}
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str, mtime_ns):
+    # mtime is part of the key, so an edited file is re-read
+    return loads(Path(path_str).read_bytes())
+
 def load_profile():
     if not PROFILE_FILE.exists():
         print(f"❌ Profile file not found at {PROFILE_FILE}")
         return None
-    with open(PROFILE_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_cached(str(PROFILE_FILE), PROFILE_FILE.stat().st_mtime_ns)
 
+@lru_cache(maxsize=512)
 def format_date_german(date_str):
     """Converts various date formats to MM.YYYY (German standard)"""
     if not date_str:
         return "Heute"
+    # Fast path for the usual YYYY-MM / YYYY-MM-DD shapes, without strptime.
+    # Days past 28 and anything unusual still go through strptime below.
+    if len(date_str) in (7, 10) and date_str[4] == '-':
+        year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+        digits = year + month + day
+        if (digits.isascii() and digits.isdigit() and year[0] != '0' and '01' <= month <= '12'
+                and (not day or (date_str[7] == '-' and '01' <= day <= '28'))):
+            return f"{month}.{year}"
     try:
         # Try YYYY-MM-DD format first
         if len(date_str) == 10:
@@ -49,38 +85,30 @@ def generate_german_cv():
     else:
         address = profile.get('address', 'Berlin, Germany')
 
-    # Header
-    markdown = f"# LEBENSLAUF\n\n"
-    
-    # 1. Persönliche Daten (Personal Details) - Critical for Germany
-    markdown += "## PERSÖNLICHE DATEN\n\n"
-    markdown += f"**Name:** {name}\n\n"
-    markdown += f"**Adresse:** {address}\n\n"
-    markdown += f"**Telefon:** {phone}\n\n"
-    markdown += f"**E-Mail:** {email}\n\n"
+    # Header and personal details
+    out = [_HEADER_TEMPLATE.format(name=name, address=address, phone=phone, email=email)]
     
     # Optional German specific fields
     if profile.get('birthdate'):
-        markdown += f"**Geburtsdatum:** {profile.get('birthdate')}\n\n"
+        out.append(f"**Geburtsdatum:** {profile.get('birthdate')}\n\n")
     if profile.get('marital_status'):
-        markdown += f"**Familienstand:** {profile.get('marital_status')}\n\n"
+        out.append(f"**Familienstand:** {profile.get('marital_status')}\n\n")
     
     # LinkedIn/GitHub if present
     if personal.get('linkedin'):
-        markdown += f"**LinkedIn:** {personal.get('linkedin')}\n\n"
+        out.append(f"**LinkedIn:** {personal.get('linkedin')}\n\n")
     if personal.get('github'):
-        markdown += f"**GitHub:** {personal.get('github')}\n\n"
+        out.append(f"**GitHub:** {personal.get('github')}\n\n")
     
     # Professional headline
     if personal.get('professional_headline'):
-        markdown += f"**Position:** {personal.get('professional_headline')}\n\n"
+        out.append(f"**Position:** {personal.get('professional_headline')}\n\n")
     
     # Photo Placeholder
-    markdown += "> ![Bewerbungsfoto](path/to/photo.jpg)\n"
-    markdown += "> *Hinweis: Ein professionelles Foto wird in Deutschland oft noch erwartet.*\n\n"
+    out.append(_PHOTO_PLACEHOLDER)
 
     # 2. Beruflicher Werdegang (Experience)
-    markdown += "## BERUFLICHER WERDEGANG\n\n"
+    out.append("## BERUFLICHER WERDEGANG\n\n")
     experience_list = profile.get('work_experience') or profile.get('experience', [])
     for job in experience_list:
         start = format_date_german(job.get('start_date'))
@@ -89,31 +117,30 @@ def generate_german_cv():
         company = job.get('company', 'Unternehmen')
         location_job = job.get('location', '')
         
-        markdown += f"### {start} – {end}\n"
-        markdown += f"**{title}** bei *{company}*"
+        out.append(f"### {start} – {end}\n")
+        out.append(f"**{title}** bei *{company}*")
         if location_job:
-            markdown += f" ({location_job})"
-        markdown += "\n\n"
+            out.append(f" ({location_job})")
+        out.append("\n\n")
         
         # Description
         if job.get('description'):
-            markdown += f"{job.get('description')}\n\n"
+            out.append(f"{job.get('description')}\n\n")
         
         # Achievements as bullet points
         achievements = job.get('achievements', [])
         if achievements:
-            markdown += "**Erfolge:**\n"
-            for achievement in achievements:
-                markdown += f"- {achievement}\n"
-            markdown += "\n"
+            out.append("**Erfolge:**\n")
+            out.extend(f"- {achievement}\n" for achievement in achievements)
+            out.append("\n")
         
         # Technologies used
         technologies = job.get('technologies', [])
         if technologies:
-            markdown += f"**Technologien:** {', '.join(technologies)}\n\n"
+            out.append(f"**Technologien:** {', '.join(technologies)}\n\n")
 
     # 3. Ausbildung (Education)
-    markdown += "## AUSBILDUNG\n\n"
+    out.append("## AUSBILDUNG\n\n")
     for edu in profile.get('education', []):
         start = format_date_german(edu.get('start_date'))
         end = format_date_german(edu.get('end_date'))
@@ -126,60 +153,57 @@ def generate_german_cv():
         
         institution = edu.get('institution') or edu.get('university', 'Universität')
         
-        markdown += f"### {start} – {end}\n"
-        markdown += f"**{degree}**\n"
-        markdown += f"*{institution}*\n\n"
+        out.append(f"### {start} – {end}\n")
+        out.append(f"**{degree}**\n")
+        out.append(f"*{institution}*\n\n")
         
         # GPA if present
         if edu.get('gpa'):
-            markdown += f"Note: {edu.get('gpa')}\n\n"
+            out.append(f"Note: {edu.get('gpa')}\n\n")
         
         # Honors
         honors = edu.get('honors', [])
         if honors:
-            markdown += f"Auszeichnungen: {', '.join(honors)}\n\n"
+            out.append(f"Auszeichnungen: {', '.join(honors)}\n\n")
 
     # 4. Kenntnisse & Fähigkeiten (Skills)
-    markdown += "## KENNTNISSE & FÄHIGKEITEN\n\n"
+    out.append("## KENNTNISSE & FÄHIGKEITEN\n\n")
     
     skills = profile.get('skills', [])
     if isinstance(skills, list):
         # Simple list of skills
-        markdown += "**Technische Fähigkeiten:**\n"
-        markdown += ", ".join(skills) + "\n\n"
+        out.append("**Technische Fähigkeiten:**\n")
+        out.append(", ".join(skills) + "\n\n")
     elif isinstance(skills, dict):
         # Categorized skills
         for category, items in skills.items():
             if isinstance(items, list):
-                markdown += f"**{category}:** {', '.join(items)}\n\n"
+                out.append(f"**{category}:** {', '.join(items)}\n\n")
             else:
-                markdown += f"**{category}:** {items}\n\n"
+                out.append(f"**{category}:** {items}\n\n")
     
     # Languages from preferences if available
     if profile.get('preferences', {}).get('required_languages'):
-        markdown += "**Sprachen:**\n"
-        for lang in profile.get('preferences', {}).get('required_languages', []):
-            markdown += f"- {lang}\n"
-        markdown += "\n"
+        out.append("**Sprachen:**\n")
+        out.extend(f"- {lang}\n" for lang in profile.get('preferences', {}).get('required_languages', []))
+        out.append("\n")
 
     # 5. Preferences Summary (for German cover letter context)
     prefs = profile.get('preferences', {})
     if prefs:
-        markdown += "## WUNSCHPROFIL (Für Anschreiben-Referenz)\n\n"
+        out.append("## WUNSCHPROFIL (Für Anschreiben-Referenz)\n\n")
         if prefs.get('desired_roles'):
-            markdown += f"**Gewünschte Positionen:** {', '.join(prefs.get('desired_roles', []))}\n\n"
+            out.append(f"**Gewünschte Positionen:** {', '.join(prefs.get('desired_roles', []))}\n\n")
         if prefs.get('remote_preference'):
-            remote_map = {
-                'remote-only': 'Nur Remote',
-                'hybrid': 'Hybrid',
-                'on-site': 'Vor Ort'
-            }
-            markdown += f"**Arbeitsmodell:** {remote_map.get(prefs.get('remote_preference'), prefs.get('remote_preference'))}\n\n"
+            out.append(f"**Arbeitsmodell:** {_REMOTE_MAP.get(prefs.get('remote_preference'), prefs.get('remote_preference'))}\n\n")
 
     # Footer (Signature place)
-    markdown += "---\n\n"
-    markdown += f"{datetime.now().strftime('%d.%m.%Y')}, {address.split(',')[0] if ',' in address else address}\n\n\n"
-    markdown += "(Unterschrift)\n"
+    out.append(_FOOTER_TEMPLATE.format(
+        date=datetime.now().strftime('%d.%m.%Y'),
+        city=address.split(',')[0] if ',' in address else address,
+    ))
+
+    markdown = "".join(out)
 
     # Save
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
@@ -1,39 +1,38 @@
 import sys
 import os
-import json
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables
+from _jsonio import dumps, loads, write_atomic
+from _runlog import open_log
+
 backend_env = Path(__file__).parent.parent / "backend" / ".env"
-load_dotenv(backend_env)
 
 # Setup logging
-log_path = Path(__file__).parent.parent / ".tmp" / "generate_keywords.log"
-def log(msg):
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
-    print(msg)
+log = open_log("generate_keywords", echo=True)
 
 log("Starting generate_keywords.py...")
 
-try:
-    # Import LLM service
-    sys.path.append(str(Path(__file__).parent.parent))
-    from backend.services.llm import generate_search_keywords
-    log("Imports successful.")
-except Exception as e:
-    log(f"Import Error: {e}")
-    sys.exit(1)
-
 def generate(profile_path):
     path = Path(profile_path)
     if not path.exists():
         log(f"Error: Profile not found: {profile_path}")
         return
 
-    with open(path, 'r', encoding='utf-8') as f:
-        profile = json.load(f)
+    # dotenv and the LLM service (requests, pydantic) are only loaded once there is a profile to work on
+    try:
+        from dotenv import load_dotenv
+        # Import LLM service
+        sys.path.append(str(Path(__file__).parent.parent))
+        from backend.services.llm import generate_search_keywords
+        log("Imports successful.")
+    except Exception as e:
+        log(f"Import Error: {e}")
+        sys.exit(1)
+
+    # Load environment variables
+    load_dotenv(backend_env)
+
+    profile = loads(path.read_bytes())
 
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
@@ -49,8 +48,7 @@ def generate(profile_path):
         if "preferences" not in profile: profile["preferences"] = {}
         profile["preferences"]["search_queries"] = keywords
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(profile, f, indent=2, ensure_ascii=False)
+        write_atomic(path, dumps(profile))
             
         log(f"Updated profile at {path}")
         
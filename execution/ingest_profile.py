@@ -9,36 +9,82 @@ Usage:
     python execution/ingest_profile.py path/to/linkedin_export.zip
 """
 
-import json
+import importlib
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import re
 
-try:
-    import pdfplumber
-    import docx
-    from jsonschema import validate
-except ImportError:
-    print("Installing required dependencies...")
-    os.system("pip install pdfplumber python-docx jsonschema")
-    import pdfplumber
-    import docx
-    from jsonschema import validate
+from _jsonio import dumps, loads, write_atomic
+from _pdf import pdf_text
+
+
+def _require(module, package):
+    """Import a heavy dependency on first use, installing it if it's missing."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        print("Installing required dependencies...")
+        os.system(f"pip install {package}")
+        return importlib.import_module(module)
+
+
+def _optional(module):
+    """Import an optional accelerator on first use, or return None."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        return None
+
+SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "profile_schema.json"
+
+# Patterns compiled once at import instead of on every call
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+# Phone candidates: runs of digit groups joined by single separators, led by an optional
+# "+" or "(". A wider gap ("   ", " - ") ends the run, so nearby dates and ranges land in
+# runs of their own instead of being glued onto the number.
+_PHONE_RUN_RE = re.compile(r'[+(]?\d+\)?\d*(?:[ \-./][+(]?\d+\)?\d*)*')
+_PHONE_GROUP_RE = re.compile(r'[+(]?\d+\)?\d*')
+# A year right after a number is a CV date, not another digit group
+_YEAR_RE = re.compile(r'(?:19|20)\d\d')
+# National numbers (leading 0 trunk prefix) are read as German, the market this tool
+# targets. Other candidates must carry a country code, so a date range like
+# "2018 - 2020" never validates as a phone number.
+_PHONE_REGION = "DE"
+# From the first non-whitespace character to the end of its line; stops at the first hit
+# instead of splitting the whole document into lines
+_FIRST_LINE_RE = re.compile(r'\S[^\n]*')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+
+# Placeholder skills taxonomy; AI extraction will replace it
+COMMON_SKILLS = (
+    'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 
+    'Kubernetes', 'SQL', 'MongoDB', 'Git', 'Java', 'C++', 'TypeScript',
+    'Vue', 'Angular', 'Django', 'Flask', 'FastAPI', 'PostgreSQL', 'Redis'
+)
+_SKILL_BY_LOWER = {s.lower(): s for s in COMMON_SKILLS}
+# One alternation for all skills, longest first. Lookarounds instead of \b so
+# names ending in punctuation ("C++") still match before a space.
+_SKILL_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(s) for s in sorted(COMMON_SKILLS, key=len, reverse=True)) + r')(?!\w)',
+    re.IGNORECASE,
+)
 
 
 def extract_text_from_pdf(pdf_path):
     """Extract all text from a PDF file."""
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text
+    if _optional("fitz") is None:
+        # pdf_text falls back to pdfplumber; install it on first use like the other parsers
+        _require("pdfplumber", "pdfplumber")
+    return pdf_text(pdf_path)
 
 
 def extract_text_from_docx(docx_path):
     """Extract all text from a DOCX file."""
+    docx = _require("docx", "python-docx")
     doc = docx.Document(docx_path)
     text = "\n".join([para.text for para in doc.paragraphs])
     return text
@@ -51,16 +97,54 @@ def extract_text_from_file(file_path):
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    if file_path.suffix.lower() == '.pdf':
+    suffix = file_path.suffix.lower()
+    if suffix == '.pdf':
         return extract_text_from_pdf(file_path)
-    elif file_path.suffix.lower() in ['.docx', '.doc']:
+    elif suffix in ('.docx', '.doc'):
         return extract_text_from_docx(file_path)
-    elif file_path.suffix.lower() == '.txt':
+    elif suffix == '.txt':
         return file_path.read_text(encoding='utf-8')
     else:
         raise ValueError(f"Unsupported file type: {file_path.suffix}")
 
 
+def _digit_count(match):
+    return sum(c.isdigit() for c in match.group(0))
+
+
+def extract_phone(text):
+    """Return the first phone number in text as written, validated with phonenumbers when it's installed."""
+    phonenumbers = _optional("phonenumbers")
+
+    def is_phone(candidate):
+        if phonenumbers is None:
+            return candidate[:1] in ('+', '0', '(') and sum(c.isdigit() for c in candidate) >= 7
+        # Covers "+49 ...", "0049 ...", "030 ..." and "(030) ..."
+        region = _PHONE_REGION if candidate.lstrip('(')[:1] in ('+', '0') else None
+        try:
+            return phonenumbers.is_valid_number(phonenumbers.parse(candidate, region))
+        except phonenumbers.NumberParseException:
+            return False
+
+    for run in _PHONE_RUN_RE.finditer(text):
+        groups = list(_PHONE_GROUP_RE.finditer(run.group(0)))
+        # Every span of whole groups, earliest start first and longest first from there,
+        # so "+49 30 1234567 2019" yields the number without the year
+        for i, first in enumerate(groups):
+            # E.164 numbers are at most 15 digits, which also bounds the spans tried per start
+            end, digits = i, 0
+            while end < len(groups) and digits + _digit_count(groups[end]) <= 15:
+                digits += _digit_count(groups[end])
+                end += 1
+            for j in range(end - 1, i - 1, -1):
+                if j > i and _YEAR_RE.fullmatch(groups[j].group(0)):
+                    continue
+                candidate = run.group(0)[first.start():groups[j].end()]
+                if is_phone(candidate):
+                    return candidate
+    return None
+
+
 def parse_profile_basic(text, file_path):
     """
     Basic regex-based parsing. 
@@ -89,58 +173,68 @@ def parse_profile_basic(text, file_path):
     }
     
     # Extract email (basic regex)
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         profile["personal_info"]["email"] = email_match.group(0)
     
-    # Extract phone (basic regex for US/international format)
-    phone_match = re.search(r'[\+]?[(]?[0-9]{1,4}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,5}[-\s\.]?[0-9]{1,5}', text)
-    if phone_match:
-        profile["personal_info"]["phone"] = phone_match.group(0)
+    # Extract phone
+    phone = extract_phone(text)
+    if phone:
+        profile["personal_info"]["phone"] = phone
     
     # Extract name (assume first non-empty line is name)
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    if lines:
-        profile["personal_info"]["full_name"] = lines[0]
+    name_match = _FIRST_LINE_RE.search(text)
+    if name_match:
+        profile["personal_info"]["full_name"] = name_match.group(0).strip()
     
     # Extract LinkedIn
-    linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
+    linkedin_match = _LINKEDIN_RE.search(text)
     if linkedin_match:
         profile["personal_info"]["linkedin"] = f"https://{linkedin_match.group(0)}"
     
     # Extract GitHub
-    github_match = re.search(r'github\.com/[\w-]+', text, re.IGNORECASE)
+    github_match = _GITHUB_RE.search(text)
     if github_match:
         profile["personal_info"]["github"] = f"https://{github_match.group(0)}"
     
     # Placeholder for skills extraction
     # This is where AI will shine - identifying skills from context
-    common_skills = [
-        'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker', 
-        'Kubernetes', 'SQL', 'MongoDB', 'Git', 'Java', 'C++', 'TypeScript',
-        'Vue', 'Angular', 'Django', 'Flask', 'FastAPI', 'PostgreSQL', 'Redis'
+    found = {m.lower() for m in _SKILL_RE.findall(text)}
+    profile["skills"]["technical"] = [
+        {
+            "name": skill,
+            "proficiency": "intermediate",  # Conservative default
+            "years_of_experience": 0
+        }
+        for key, skill in _SKILL_BY_LOWER.items() if key in found
     ]
     
-    for skill in common_skills:
-        if re.search(rf'\b{skill}\b', text, re.IGNORECASE):
-            profile["skills"]["technical"].append({
-                "name": skill,
-                "proficiency": "intermediate",  # Conservative default
-                "years_of_experience": 0
-            })
-    
     return profile
 
 
+@lru_cache(maxsize=4)
+def _compile_validator(path_str, mtime_ns):
+    schema = loads(Path(path_str).read_bytes())
+    # Generates straight-line Python from the schema; much faster than jsonschema
+    fastjsonschema = _optional("fastjsonschema")
+    if fastjsonschema is not None:
+        # jsonschema ignores "format" by default; keep the same verdicts
+        return fastjsonschema.compile(schema, use_formats=False)
+    validators = _require("jsonschema.validators", "jsonschema")
+    return validators.validator_for(schema)(schema).validate
+
+
+def get_profile_validator():
+    """Compile the profile schema into a validate(profile) callable, cached until the file changes."""
+    return _compile_validator(str(SCHEMA_PATH), SCHEMA_PATH.stat().st_mtime_ns)
+
+
 def validate_profile(profile):
     """Validate profile against schema."""
-    schema_path = Path(__file__).parent.parent / "schemas" / "profile_schema.json"
-    
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
+    validate = get_profile_validator()
     
     try:
-        validate(instance=profile, schema=schema)
+        validate(profile)
         return True, None
     except Exception as e:
         return False, str(e)
@@ -153,8 +247,7 @@ def save_profile(profile, output_path=None):
         output_dir.mkdir(exist_ok=True)
         output_path = output_dir / "user_profile.json"
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(profile, f, indent=2, ensure_ascii=False)
+    write_atomic(Path(output_path), dumps(profile))
     
     return output_path
 
@@ -1,5 +1,4 @@
 from playwright.sync_api import sync_playwright
-import time
 import os
 from pathlib import Path
 
@@ -31,13 +30,14 @@ def login_arbeitsagentur():
         
         print("\n⏳ Waiting for you to log in...")
         print("Please navigate to 'Jobbörse' -> 'Meine Vormerkungen' after login.")
-        print("Press CTRL+C in the terminal when you are done and want to close.")
+        print("Close the browser window (or press CTRL+C in the terminal) when you are done.")
         
         try:
-            # Keep browser open until user is done
+            # Keep browser open until user is done.
+            # Blocks on the close event itself, so nothing wakes up while we wait.
             # In a real app we might check for a specific selector like "Logout"
-            while True:
-                time.sleep(1)
+            browser.wait_for_event("close", timeout=0)
+            print("\n✅ Session captured! Browser closed.")
         except KeyboardInterrupt:
             print("\n✅ Session captured! Closing browser.")
             browser.close()
@@ -1,93 +1,132 @@
-import requests
-import json
+import asyncio
 import os
+import sys
 from pathlib import Path
 import random
 import time
+import _cache
+from _cache import fetch_cached, SEARCH_TTL
+from _jsonio import dumps, loads
 
 # Configuration
 KEYWORDS = "Softwareentwickler" # Changed to German term
 LOCATION = "Berlin"
 RADIUS = 50
+PAGES = 4
+PAGE_SIZE = 25
+# Page requests in flight at once; keeps us polite to the API
+MAX_CONCURRENCY = 8
+
+# Geocoding Mock: Berlin Center, with a wider spread (0.15) to cover more of Berlin
+BERLIN_LAT = 52.5200
+BERLIN_LNG = 13.4050
+GEO_SPREAD = 0.15
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 OUTPUT_FILE = BASE_DIR / ".tmp" / "jobs_found.json"
 FILTERED_FILE = BASE_DIR / ".tmp" / "jobs_filtered.json"
 
-def scrape_arbeitsagentur():
-    """
-    Scrapes the official Arbeitsagentur Jobbörse API.
-    Refined with correct GET parameters for public access.
-    """
-    print(f"🇩🇪 Scraping Arbeitsagentur for '{KEYWORDS}' in {LOCATION}...")
-    
-    # This URL is more reliable for unauthenticated search
-    url = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/app/jobs"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "application/json",
-        "Origin": "https://www.arbeitsagentur.de",
-        "Referer": "https://www.arbeitsagentur.de/",
-        "X-API-Key": "jobboerse-jobsuche"
+def build_job(item):
+    """Map one Jobbörse listing to our job dict."""
+    # Extract relevant fields
+    job = {
+        "id": item.get("refnr"),
+        "title": item.get("titel"),
+        "company": item.get("arbeitgeber"),
+        "location": item.get("ort"),
+        "description": "See link for details", # Minimal description from list view
+        "url": f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{item.get('refnr')}",
+        "source": "Arbeitsagentur",
+        "posted_at": item.get("eintrittsdatum"),
+        "match_score": random.randint(60, 95), # Mock AI Score
+        "status": "new"
     }
     
+    # Geocoding Mock (Berlin Center + Spread)
+    job["latitude"] = BERLIN_LAT + (random.random() - 0.5) * GEO_SPREAD
+    job["longitude"] = BERLIN_LNG + (random.random() - 0.5) * GEO_SPREAD
+    
+    return job
+
+# This URL is more reliable for unauthenticated search
+API_URL = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/app/jobs"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "application/json",
+    "Origin": "https://www.arbeitsagentur.de",
+    "Referer": "https://www.arbeitsagentur.de/",
+    "X-API-Key": "jobboerse-jobsuche"
+}
+
+def fetch_page(page):
+    """Fetch one result page and return its jobs ([] if the page fails)."""
     # Updated Params based on latest frontend checks
     params = {
         "was": KEYWORDS,
         "wo": LOCATION,
-        "page": 1,
-        "size": 25,
+        "page": page,
+        "size": PAGE_SIZE,
         "arbeitgeber": "BA",
         "umkreis": RADIUS
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        status, body = fetch_cached("GET", API_URL, SEARCH_TTL, params, headers=HEADERS, params=params, timeout=10)
         
         # Debugging
-        print(f"Status Code: {response.status_code}")
-        if response.status_code != 200:
-            print(f"Response: {response.text}")
-            
-        data = response.json()
-        
-        jobs = []
-        raw_jobs = data.get("result", {}).get("items", [])
-        
-        print(f"✅ Found {len(raw_jobs)} raw jobs.")
-        
-        for item in raw_jobs:
-            # Extract relevant fields
-            job = {
-                "id": item.get("refnr"),
-                "title": item.get("titel"),
-                "company": item.get("arbeitgeber"),
-                "location": item.get("ort"),
-                "description": "See link for details", # Minimal description from list view
-                "url": f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{item.get('refnr')}",
-                "source": "Arbeitsagentur",
-                "posted_at": item.get("eintrittsdatum"),
-                "match_score": random.randint(60, 95), # Mock AI Score
-                "status": "new"
-            }
-            
-            # Geocoding Mock (Berlin Center + Spread)
-            base_lat = 52.5200 
-            base_lng = 13.4050
-            # Wider spread (0.15) to cover more of Berlin
-            job["latitude"] = base_lat + (random.random() - 0.5) * 0.15
-            job["longitude"] = base_lng + (random.random() - 0.5) * 0.15
+        print(f"Page {page} Status Code: {status}")
+        if status != 200:
+            # Error pages can be large HTML; show the start and don't try to parse them
+            print(f"Response: {body[:500].decode('utf-8', 'replace')}")
+            return []
             
-            jobs.append(job)
-            
-        return jobs
+        items = loads(body).get("result", {}).get("items", [])
+        return [build_job(item) for item in items]
 
     except Exception as e:
-        print(f"❌ Error scraping Arbeitsagentur: {e}")
+        print(f"❌ Error scraping Arbeitsagentur page {page}: {e}")
         return []
 
+async def _fetch_all_pages():
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    
+    async def fetch(page):
+        async with semaphore:
+            # requests is blocking, so each page is fetched on a worker thread
+            return await asyncio.to_thread(fetch_page, page)
+    
+    # gather keeps page order
+    return await asyncio.gather(*(fetch(page) for page in range(1, PAGES + 1)))
+
+async def scrape_arbeitsagentur_async():
+    """
+    Scrapes the official Arbeitsagentur Jobbörse API.
+    Refined with correct GET parameters for public access.
+    Pages are fetched concurrently, MAX_CONCURRENCY at a time.
+    """
+    print(f"🇩🇪 Scraping Arbeitsagentur for '{KEYWORDS}' in {LOCATION}...")
+    
+    jobs = []
+    seen = set()
+    for page_jobs in await _fetch_all_pages():
+        for job in page_jobs:
+            # Listings can shift between pages while we fetch them
+            if job["id"]:
+                if job["id"] in seen:
+                    continue
+                seen.add(job["id"])
+            jobs.append(job)
+    
+    print(f"✅ Found {len(jobs)} raw jobs.")
+    
+    return jobs
+
+def scrape_arbeitsagentur():
+    """Blocking wrapper around scrape_arbeitsagentur_async for scripts."""
+    return asyncio.run(scrape_arbeitsagentur_async())
+
 def main():
     # Ensure .tmp exists
     os.makedirs(BASE_DIR / ".tmp", exist_ok=True)
@@ -96,12 +135,11 @@ def main():
     
     if jobs:
         # Save RAW findings
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, indent=2, ensure_ascii=False)
+        data = dumps(jobs)  # encode once, write twice
+        OUTPUT_FILE.write_bytes(data)
         
         # Update FILTERED file for Dashboard
-        with open(FILTERED_FILE, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, indent=2, ensure_ascii=False)
+        FILTERED_FILE.write_bytes(data)
         print(f"💾 Updated dashboard data file: {FILTERED_FILE}")
         
         print(f"\n🚀 SUCCESS! Found {len(jobs)} jobs. Dashboard updated.")
@@ -129,9 +167,9 @@ def create_mock_data():
             "latitude": 52.50, "longitude": 13.45
         }
     ]
-    with open(FILTERED_FILE, "w", encoding="utf-8") as f:
-        json.dump(mock_jobs, f, indent=2, ensure_ascii=False)
+    FILTERED_FILE.write_bytes(dumps(mock_jobs))
     print("💾 Saved fallback mock data.")
 
 if __name__ == "__main__":
+    _cache.handle_no_cache_flag(sys.argv)
     main()
@@ -1,30 +1,43 @@
+import asyncio
 import sys
 import os
-import json
-import time
+import random
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
-import requests
+import _cache
+from _cache import fetch_cached, SEARCH_TTL
+from _http import RETRY_POST_SESSION
+from _jsonio import dumps, loads, write_atomic
+from _runlog import open_log
 
 # Load env vars
 load_dotenv()
 
 # Setup logging
-log_path = Path(__file__).parent.parent / ".tmp" / "scrape_linkedin.log"
-def log(msg):
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
-    print(msg)
+log = open_log("scrape_linkedin", echo=True)
 
 log("Starting scrape_linkedin.py...")
 
+# Firecrawl searches in flight at once
+MAX_CONCURRENCY = 5
+# Job postings live under /jobs/ (which also covers /jobs/view/); profiles and
+# company pages don't. A plain substring test is a single C-level scan.
+JOB_LINK_MARKER = "/jobs/"
+
+@lru_cache(maxsize=1)
+def _load_profile_cached(path_str, mtime_ns):
+    # Read-only view: the cached dict is shared between callers
+    return MappingProxyType(loads(Path(path_str).read_bytes()))
+
 def load_profile():
+    """Parsed user profile, re-read only when the file changes."""
     path = Path(__file__).parent.parent / ".tmp" / "user_profile.json"
     if not path.exists():
         log("Profile not found. Please run ingest_cv.py first.")
         sys.exit(1)
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _load_profile_cached(str(path), path.stat().st_mtime_ns)
 
 def get_search_queries(profile):
     """Get AI generated queries or fallback to manual build."""
@@ -45,232 +58,118 @@ def get_search_queries(profile):
     
     return [f'site:linkedin.com/jobs ({skills_query}) "{location}" {level_kw}']
 
-def scrape_linkedin_jobs(queries):
-    """Use Firecrawl Search to find LinkedIn jobs for multiple queries."""
-    api_key = os.getenv("FIRECRAWL_API_KEY")
-    if not api_key:
-        log("Error: FIRECRAWL_API_KEY not set.")
-        return []
-        
+def parse_search_results(data, query):
+    """Turn one Firecrawl search response into job dicts, keeping only job pages."""
+    results = []
+    if data.get("success"):
+        for item in data.get("data", []):
+            title_company = item.get("title", "").split(" | ")[0]
+            parts = title_company.split(" - ")
+            
+            title = parts[0] if parts else "Unknown Role"
+            company = parts[1] if len(parts) > 1 else "Unknown Company"
+            
+            job = {
+                "title": title,
+                "company": company,
+                "link": item.get("url"),
+                "description": item.get("description", "")[:500] + "...", # Capture more for filtering
+                "source": "LinkedIn",
+                "date_posted": "Recent",
+                "location": "Berlin", # We enforced this in query
+                "query_used": query
+            }
+            
+            if JOB_LINK_MARKER in (job["link"] or ""):
+                 results.append(job)
+    return results
+
+async def search_one(query, headers, semaphore):
+    """Run one Firecrawl search; at most MAX_CONCURRENCY of these are in flight."""
     url = "https://api.firecrawl.dev/v1/search"
-    headers = {"Authorization": f"Bearer {api_key}"}
-    
-    all_results = []
     
-    for query in queries:
-        # Enforce Berlin if missing (Safety check)
-        if "berlin" not in query.lower():
-            query += " Berlin"
-            
-        log(f"🔍 Searching: {query}")
+    # Enforce Berlin if missing (Safety check)
+    if "berlin" not in query.lower():
+        query += " Berlin"
         
-        payload = {
-            "query": query,
-            "limit": 5, 
-            "scrapeOptions": {
-                "formats": ["markdown"]
-            }
+    payload = {
+        "query": query,
+        "limit": 5, 
+        "scrapeOptions": {
+            "formats": ["markdown"]
         }
-        
+    }
+    
+    async with semaphore:
+        log(f"🔍 Searching: {query}")
         try:
-            response = requests.post(url, json=payload, headers=headers)
-            if response.status_code == 429:
-                log("Rate limited. Waiting 10s...")
-                time.sleep(10)
-                response = requests.post(url, json=payload, headers=headers)
-                
-            response.raise_for_status()
-            data = response.json()
+            # requests is blocking, so each call runs on a worker thread.
+            # Search is a read, so this POST opts in to the session's backoff
+            # and retry on 429/5xx; repeats of a recent query are answered from the cache.
+            status, body = await asyncio.to_thread(
+                fetch_cached, "POST", url, SEARCH_TTL, payload,
+                session=RETRY_POST_SESSION, json=payload, headers=headers,
+            )
+            if status != 200:
+                raise RuntimeError(f"HTTP {status}")
+            data = loads(body)
             
-            if data.get("success"):
-                for item in data.get("data", []):
-                    title_company = item.get("title", "").split(" | ")[0]
-                    parts = title_company.split(" - ")
-                    
-                    title = parts[0] if parts else "Unknown Role"
-                    company = parts[1] if len(parts) > 1 else "Unknown Company"
-                    
-                    job = {
-                        "title": title,
-                        "company": company,
-                        "link": item.get("url"),
-                        "description": item.get("description", "")[:500] + "...", # Capture more for filtering
-                        "source": "LinkedIn",
-                        "date_posted": "Recent",
-                        "location": "Berlin", # We enforced this in query
-                        "query_used": query
-                    }
-                    
-                    if "/jobs/view/" in job["link"] or "/jobs/" in job["link"]:
-                         all_results.append(job)
-                         
-            time.sleep(2) # Be polite
+            # Be polite: a short jittered pause per slot instead of 2s between every query
+            await asyncio.sleep(random.uniform(0.3, 0.8))
             
         except Exception as e:
             log(f"Firecrawl Search Failed for '{query}': {e}")
-            
-    return all_results
-
-if __name__ == "__main__":
-    profile = load_profile()
-    queries = get_search_queries(profile)
-    
-    # Cap queries to avoid burning credits
-    if len(queries) > 5:
-        queries = queries[:5]
-        
-    jobs = scrape_linkedin_jobs(queries)
-    
-    log(f"Found {len(jobs)} total jobs.")
-    
-    output_path = Path(__file__).parent.parent / ".tmp" / "jobs_found.json"
-    
-    existing_jobs = []
-    if output_path.exists():
-        with open(output_path, 'r', encoding='utf-8') as f:
-            try:
-                existing_jobs = json.load(f)
-            except: pass
-            
-    existing_links = {j.get("link") for j in existing_jobs}
+            return []
     
-    new_count = 0
-    for job in jobs:
-        if job["link"] not in existing_links:
-            existing_jobs.append(job)
-            new_count += 1
-            
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(existing_jobs, f, indent=2, ensure_ascii=False)
-        
-    log(f"Added {new_count} new jobs to {output_path}")
-
-
-# Setup logging
-log_path = Path(__file__).parent.parent / ".tmp" / "scrape_linkedin.log"
-def log(msg):
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
-
-log("Starting scrape_linkedin.py...")
-
-def load_profile():
-    path = Path(__file__).parent.parent / ".tmp" / "user_profile.json"
-    if not path.exists():
-        log("Profile not found. Please run ingest_cv.py first.")
-        sys.exit(1)
-    with open(path, 'r') as f:
-        return json.load(f)
+    return parse_search_results(data, query)
 
-def build_search_query(profile):
-    """Build a targeted search query based on profile data."""
-    skills = profile.get("skills", [])
-    exp_level = profile.get("experience_level", "Experienced")
-    
-    # Get top 3 skills to avoid query getting too long
-    top_skills = skills[:3] if skills else ["Software Engineer"]
-    skills_query = " OR ".join([f'"{s}"' for s in top_skills])
-    
-    # Location (Default to Berlin/Germany as per user request, or from config if available)
-    # The user mentioned "Germany berlin" in the prompt.
-    location = "Berlin" 
-    
-    # Experience Level Keywords
-    level_kw = ""
-    if exp_level == "Fresher":
-        level_kw = '("Intern" OR "Junior" OR "Trainee" OR "Entry Level")'
-    else:
-        # For experienced, maybe exclude intern
-        level_kw = '-Intern -Student'
-        
-    query = f'site:linkedin.com/jobs ({skills_query}) "{location}" {level_kw}'
-    return query
+async def _search_all(queries, headers):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    batches = await asyncio.gather(*(search_one(q, headers, semaphore) for q in queries))
+    # gather keeps query order, so results come out in the same order as before
+    return [job for batch in batches for job in batch]
 
-def scrape_linkedin_jobs(query):
-    """Use Firecrawl Search to find LinkedIn jobs."""
+def scrape_linkedin_jobs(queries):
+    """Use Firecrawl Search to find LinkedIn jobs for multiple queries, concurrently."""
     api_key = os.getenv("FIRECRAWL_API_KEY")
     if not api_key:
         log("Error: FIRECRAWL_API_KEY not set.")
         return []
         
-    url = "https://api.firecrawl.dev/v1/search"
     headers = {"Authorization": f"Bearer {api_key}"}
-    
-    payload = {
-        "query": query,
-        "limit": 5, # Start small
-        "scrapeOptions": {
-            "formats": ["markdown"]
-        }
-    }
-    
-    log(f"Searching: {query}")
-    
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        if data.get("success"):
-            for item in data.get("data", []):
-                # Basic parsing of search result
-                # LinkedIn titles often look like "Role - Company | LinkedIn"
-                title_company = item.get("title", "").split(" | ")[0]
-                parts = title_company.split(" - ")
-                
-                title = parts[0] if parts else "Unknown Role"
-                # Sometimes company is in description or second part of title
-                company = parts[1] if len(parts) > 1 else "Unknown Company"
-                
-                job = {
-                    "title": title,
-                    "company": company,
-                    "link": item.get("url"),
-                    "description": item.get("description", "")[:200] + "...",
-                    "source": "LinkedIn",
-                    "date_posted": "Recent", # Search results might not have precise date
-                    "location": "Berlin" # Assumed from query
-                }
-                
-                # Filter out non-job pages (e.g. profiles)
-                if "/jobs/view/" in job["link"] or "/jobs/" in job["link"]:
-                     results.append(job)
-        
-        return results
-        
-    except Exception as e:
-        log(f"Firecrawl Search Failed: {e}")
-        return []
+    return asyncio.run(_search_all(queries, headers))
 
 if __name__ == "__main__":
+    _cache.handle_no_cache_flag(sys.argv)
     profile = load_profile()
-    query = build_search_query(profile)
+    queries = get_search_queries(profile)
     
-    jobs = scrape_linkedin_jobs(query)
+    # Cap queries to avoid burning credits
+    if len(queries) > 5:
+        queries = queries[:5]
+        
+    jobs = scrape_linkedin_jobs(queries)
     
-    log(f"Found {len(jobs)} jobs.")
+    log(f"Found {len(jobs)} total jobs.")
     
-    # Append to jobs_found.json
     output_path = Path(__file__).parent.parent / ".tmp" / "jobs_found.json"
     
     existing_jobs = []
     if output_path.exists():
-        with open(output_path, 'r') as f:
-            try:
-                existing_jobs = json.load(f)
-            except: pass
+        try:
+            existing_jobs = loads(output_path.read_bytes())
+        except: pass
             
-    # Simple dedup based on link
     existing_links = {j.get("link") for j in existing_jobs}
     
     new_count = 0
     for job in jobs:
         if job["link"] not in existing_links:
             existing_jobs.append(job)
+            # Also catches the same posting returned by two queries in this run
+            existing_links.add(job["link"])
             new_count += 1
             
-    with open(output_path, 'w') as f:
-        json.dump(existing_jobs, f, indent=2)
+    write_atomic(output_path, dumps(existing_jobs))
         
     log(f"Added {new_count} new jobs to {output_path}")
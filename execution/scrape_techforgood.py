@@ -1,18 +1,25 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import importlib.util
 import sys
 import os
 from dotenv import load_dotenv
+import _cache
+from _cache import fetch_cached, SEARCH_TTL, EXTRACT_TTL
+from _jsonio import dumps, loads
 
 # Load environment variables
 load_dotenv()
 
+# The listing page has a stable card layout, so the direct parser is the default.
+# Firecrawl's LLM extraction costs credits and seconds per call; opt in with
+# USE_FIRECRAWL=1 or --llm-extract.
+USE_FIRECRAWL = os.getenv("USE_FIRECRAWL", "0") == "1"
+
 
 def scrape_jobs(keyword, location="remote"):
     """
-    Scrape jobs using Firecrawl API for reliability.
-    Falls back to basic requests if Firecrawl is not available.
+    Scrape jobs straight from the listing page.
+    Firecrawl's LLM extraction is used when USE_FIRECRAWL is on, or when the
+    page no longer matches the card layout the direct parser knows.
     """
     base_url = "https://techjobsforgood.com/jobs/"
     params = {
@@ -26,10 +33,9 @@ def scrape_jobs(keyword, location="remote"):
     print(f"Searching for '{keyword}' in '{location}'...")
     print(f"URL: {search_url}")
     
-    # Try Firecrawl first (if environment variable is set)
     firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY")
     
-    if firecrawl_api_key:
+    if USE_FIRECRAWL and firecrawl_api_key:
         try:
             print(f"Using Firecrawl API for extraction (Key length: {len(firecrawl_api_key)})...")
             return scrape_with_firecrawl(search_url, keyword)
@@ -37,15 +43,23 @@ def scrape_jobs(keyword, location="remote"):
             print(f"Firecrawl failed: {e}, falling back to basic scraping...")
             import traceback
             traceback.print_exc()
+        return scrape_with_requests(search_url)
+    
+    jobs = scrape_with_requests(search_url)
+    
+    if not jobs and firecrawl_api_key:
+        # No cards matched: the layout may have changed, let the LLM extractor try
+        print("No job cards found with the direct parser, trying Firecrawl extraction...")
+        try:
+            return scrape_with_firecrawl(search_url, keyword)
+        except Exception as e:
+            print(f"Firecrawl failed: {e}")
     
-    # Fallback to basic requests
-    return scrape_with_requests(search_url)
+    return jobs
 
 
 def scrape_with_firecrawl(url, keyword):
     """Use Firecrawl API to extract job listings."""
-    import requests as req
-    
     api_key = os.getenv("FIRECRAWL_API_KEY")
     api_url = "https://api.firecrawl.dev/v1/extract"
     
@@ -81,14 +95,15 @@ def scrape_with_firecrawl(url, keyword):
     }
     
     try:
-        response = req.post(api_url, json=payload, headers=headers)
-        print(f"Firecrawl Status Code: {response.status_code}")
+        # Not retried: each extract call is billed, and a 5xx may still have started the job
+        status, body = fetch_cached("POST", api_url, EXTRACT_TTL, payload, json=payload, headers=headers)
+        print(f"Firecrawl Status Code: {status}")
         
-        if response.status_code != 200:
-            print(f"Firecrawl Error Response: {response.text}")
-            response.raise_for_status()
+        if status != 200:
+            print(f"Firecrawl Error Response: {body[:500].decode('utf-8', 'replace')}")
+            raise RuntimeError(f"Firecrawl returned HTTP {status}")
         
-        data = response.json()
+        data = loads(body)
         print(f"Firecrawl Response Data Keys: {data.keys()}")
         
         if not data.get("success"):
@@ -108,40 +123,77 @@ def scrape_with_firecrawl(url, keyword):
         raise e
 
 
+def iter_cards(html):
+    """
+    Yield (href, text, company, location) for each job card on a results page.
+    text is the card's text joined with "|"; company/location are None when the
+    card has no such tag.
+    """
+    # Based on investigation, job cards use structure:
+    # a.content contains the link and wraps company/location
+    try:
+        # C (Lexbor) parser with CSS selectors, much faster than BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        LexborHTMLParser = None
+    
+    if LexborHTMLParser is not None:
+        for a in LexborHTMLParser(html).css('a.content'):
+            company_tag = a.css_first('span.company_name')
+            location_tag = a.css_first('span.location')
+            yield (
+                a.attributes.get('href') or '',
+                a.text(separator="|"),
+                company_tag.text() if company_tag is not None else None,
+                location_tag.text() if location_tag is not None else None,
+            )
+        return
+    
+    from bs4 import BeautifulSoup
+    # lxml's C parser is still several times faster than html.parser
+    parser = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+    for a in BeautifulSoup(html, parser).select('a.content'):
+        company_tag = a.select_one('span.company_name')
+        location_tag = a.select_one('span.location')
+        yield (
+            a.get('href', ''),
+            a.get_text(separator="|"),
+            company_tag.text if company_tag is not None else None,
+            location_tag.text if location_tag is not None else None,
+        )
+
+
 def scrape_with_requests(url):
-    """Basic fallback scraping using requests + BeautifulSoup."""
+    """Basic fallback scraping using requests + an HTML parser."""
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     }
-    response = requests.get(url, headers=headers)
+    status, body = fetch_cached("GET", url, SEARCH_TTL, {}, headers=headers)
     
-    if response.status_code != 200:
-        print(f"Error: Received status code {response.status_code}")
+    if status != 200:
+        print(f"Error: Received status code {status}")
         return []
     
-    soup = BeautifulSoup(response.text, 'html.parser')
     jobs = []
+    seen = set()
     
-    # Based on investigation, job cards use structure:
-    # a.content contains the link and wraps company/location
-    for a in soup.select('a.content'):
-        href = a.get('href', '')
+    for href, content_text, company_text, location_text in iter_cards(body):
         if not href:
             continue
             
         full_link = "https://techjobsforgood.com" + href if href.startswith("/") else href
+        # Skip cards we've already collected
+        if full_link in seen:
+            continue
+        seen.add(full_link)
         
         # The title isn't directly in the card according to agent, 
         # but let's see if we can find it in the content text
-        content_text = a.get_text(separator="|").strip()
-        lines = [l.strip() for l in content_text.split("|") if l.strip()]
+        lines = [l.strip() for l in content_text.strip().split("|") if l.strip()]
         
         # Heuristic: First line might be company if title is missing
-        company_tag = a.select_one('span.company_name')
-        location_tag = a.select_one('span.location')
-        
-        company = company_tag.text.strip() if company_tag else (lines[0] if lines else "Unknown")
-        loc = location_tag.text.strip() if location_tag else "Remote"
+        company = company_text.strip() if company_text is not None else (lines[0] if lines else "Unknown")
+        loc = location_text.strip() if location_text is not None else "Remote"
         
         # If the agent said title is missing from card, let's use a placeholder or follow the link
         # For now, let's assume the first non-company/non-location string is descriptive
@@ -159,14 +211,17 @@ def scrape_with_requests(url):
             "source": "Tech Jobs for Good"
         }
         
-        if not any(j['link'] == job['link'] for j in jobs):
-            jobs.append(job)
+        jobs.append(job)
     
     return jobs
 
 if __name__ == "__main__":
+    _cache.handle_no_cache_flag(sys.argv)
+    if "--llm-extract" in sys.argv:
+        sys.argv.remove("--llm-extract")
+        USE_FIRECRAWL = True
     if len(sys.argv) < 2:
-        print("Usage: python scrape_techforgood.py <keyword> [location]")
+        print("Usage: python scrape_techforgood.py <keyword> [location] [--no-cache] [--llm-extract]")
         sys.exit(1)
         
     keyword = sys.argv[1]
@@ -178,8 +233,8 @@ if __name__ == "__main__":
     
     try:
         results = scrape_jobs(keyword, location)
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(dumps(results))
         print(f"Found {len(results)} jobs. Results saved to {output_path}")
     except Exception as e:
         print(f"An error occurred: {e}")
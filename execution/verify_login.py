@@ -1,37 +1,47 @@
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
-import time
+import asyncio
+import re
 
 # Config
 BASE_DIR = Path(__file__).parent.parent
 USER_DATA_DIR = BASE_DIR / ".tmp" / "chrome_user_data_german"
+# Only shown to a logged-in user
+LOGGED_IN_MARKERS = re.compile("Abmelden|Profil|Meine Vormerkungen")
 
-def verify_session():
+async def verify_session_async():
     """
     Verifies if the saved browser session is still logged in.
+    Returns True/False. Async so it can run alongside other IO-bound work,
+    e.g. asyncio.gather(verify_session_async(), scrape_arbeitsagentur_async()).
     """
     print("🕵️ Checking if we are logged in...")
     
-    with sync_playwright() as p:
+    async with async_playwright() as p:
         try:
-            browser = p.chromium.launch_persistent_context(
+            browser = await p.chromium.launch_persistent_context(
                 user_data_dir=USER_DATA_DIR,
                 headless=True, # Headless for verification
             )
             
-            page = browser.new_page()
+            page = await browser.new_page()
             
             # Navigate to a page that requires login
             # "Meine Vormerkungen" (Saved Jobs) usually requires auth
             target_url = "https://www.arbeitsagentur.de/eservices-esuche/j/index.jsf"
-            page.goto(target_url)
-            page.wait_for_load_state("networkidle")
+            await page.goto(target_url)
             
             # Check for "Abmelden" (Logout) or "Profil" text
-            # This confirms we are inside
-            content = page.content()
+            # This confirms we are inside. Waiting for the text itself returns as
+            # soon as it renders, instead of waiting for the network to go idle
+            # and pulling the whole DOM back into Python.
+            try:
+                await page.get_by_text(LOGGED_IN_MARKERS).first.wait_for(timeout=5000)
+                logged_in = True
+            except PlaywrightTimeoutError:
+                logged_in = False
             
-            if "Abmelden" in content or "Profil" in content or "Meine Vormerkungen" in content:
+            if logged_in:
                 print("✅ SUCCESS: You are logged in!")
                 print("   The bot can now scrape your private job recommendations.")
             else:
@@ -39,11 +49,17 @@ def verify_session():
                 print("   The session cookie might have expired or wasn't saved.")
                 print("   Please run 'python execution/login_arbeitsagentur.py' again.")
                 
-            browser.close()
+            await browser.close()
+            return logged_in
             
         except Exception as e:
             print(f"❌ Error checking session: {e}")
             print("make sure you closed the previous Chrome window completely!")
+            return False
+
+def verify_session():
+    """Blocking wrapper around verify_session_async for scripts."""
+    return asyncio.run(verify_session_async())
 
 if __name__ == "__main__":
     verify_session()